@@ -3,10 +3,10 @@
 # ---------------------------------------------------
 import os
 import glob
-import io
+import importlib.util
 import time
-import hashlib
-import base64
+import tempfile
+from functools import lru_cache
 
 import numpy as np
 import pandas as pd
@@ -16,13 +16,9 @@ import plotly.io as pio
 import streamlit as st
 
 # --- Optional: semantic embeddings (AI search) ---
-try:
-    from sentence_transformers import SentenceTransformer
-
-    HAS_EMBED = True
-except Exception:
-    HAS_EMBED = False
-    SentenceTransformer = None
+# Only check availability here; the package (and torch) is imported the first
+# time a semantic search actually runs, keeping cold start light.
+HAS_EMBED = importlib.util.find_spec("sentence_transformers") is not None
 
 APP_VERSION = "Think Studio ALPHA v3.2 - 2025-11-16"
 
@@ -142,52 +138,150 @@ REQUIRED = [
 ]
 
 
-def file_md5(path: str) -> str:
-    h = hashlib.md5()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+CATEGORY_COLS = ["org_type", "country", "scope", "source"]
 
+# Parse schema for the known text columns so the reader skips type inference
+# on them; year is still inferred and coerced below
+TEXT_DTYPES = {c: "string[pyarrow]" for c in REQUIRED if c != "year"}
 
-def bytes_md5(b: bytes) -> str:
-    return hashlib.md5(b).hexdigest()
 
+def file_key(path: str) -> str:
+    """
+    Cheap cache key for a CSV on disk: path, mtime and size from one stat()
+    call, so cache lookups never have to read the file.
+    """
+    stat = os.stat(path)
+    return f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
 
-@st.cache_data(show_spinner=False)
-def load_data_from_path(path: str, file_hash: str, app_version: str):
-    df = pd.read_csv(path).fillna("")
-    missing = [c for c in REQUIRED if c not in df.columns]
-    if missing:
-        raise ValueError(f"Missing columns: {missing}")
-    df["year"] = pd.to_numeric(df["year"], errors="coerce")
-    return df
 
+def rewind(source):
+    """Move a file-like source back to the start so it can be read again."""
+    if hasattr(source, "seek"):
+        source.seek(0)
 
-@st.cache_data(show_spinner=False)
-def load_data_from_bytes(content: bytes, file_hash: str, app_version: str):
-    df = pd.read_csv(io.BytesIO(content)).fillna("")
-    missing = [c for c in REQUIRED if c not in df.columns]
-    if missing:
-        raise ValueError(f"Missing columns: {missing}")
-    df["year"] = pd.to_numeric(df["year"], errors="coerce")
+
+def missing_columns(source) -> list:
+    """REQUIRED columns absent from the CSV header."""
+    rewind(source)
+    header = pd.read_csv(source, nrows=0).columns
+    return [c for c in REQUIRED if c not in header]
+
+
+def read_strategies_csv(source) -> pd.DataFrame:
+    """
+    Parse and validate a strategies CSV from a path or file-like object.
+    Uses the pyarrow engine, which parses blocks in parallel in C++, and
+    falls back to the C parser for files with ragged rows.
+    """
+    # Only the columns the app uses are parsed; extras are never materialised
+    read_kwargs = {"dtype_backend": "pyarrow", "usecols": REQUIRED, "dtype": TEXT_DTYPES}
+    try:
+        df = pd.read_csv(source, engine="pyarrow", **read_kwargs)
+    except KeyError:
+        # pyarrow refuses usecols naming an absent column; report which ones
+        raise ValueError(f"Missing columns: {missing_columns(source)}") from None
+    except pd.errors.ParserError:
+        # pyarrow rejects ragged rows; the C parser pads short rows with NA
+        rewind(source)
+        try:
+            df = pd.read_csv(source, **read_kwargs)
+        except ValueError:
+            missing = missing_columns(source)
+            if not missing:
+                raise
+            raise ValueError(f"Missing columns: {missing}") from None
+    # Nullable 2-byte integers instead of float64 with NaN; fractional or
+    # out-of-range years become missing rather than failing the cast
+    year = pd.to_numeric(df["year"], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    valid = (year % 1 == 0) & (year >= -32768) & (year <= 32767)
+    df["year"] = pd.Series(np.where(valid, year, np.nan), index=df.index).astype("Int16")
+    # Text columns are Arrow-backed strings (TEXT_DTYPES); blank rather than null
+    text_cols = list(TEXT_DTYPES)
+    df[text_cols] = df[text_cols].fillna("")
+    # Low-cardinality filter columns: isin/groupby/nunique work on int codes
+    for col in CATEGORY_COLS:
+        df[col] = df[col].astype("category")
     return df
 
 
+# cache_resource hands back the same DataFrame without pickling a copy on
+# every hit; callers must treat it as read-only.
+@st.cache_resource(show_spinner=False)
+def load_data_from_path(path: str, file_hash: str, app_version: str):
+    return read_strategies_csv(path)
+
+
+def clear_data_caches():
+    st.cache_data.clear()
+    load_data_from_path.clear()
+    search_corpus.clear()
+
+
+# Uploads are spooled into one app-owned directory; copies left behind by
+# sessions that ended without replacing them are swept after a day unused
+UPLOAD_DIR = os.path.join(tempfile.gettempdir(), "think_studio_uploads")
+UPLOAD_TTL_SECONDS = 24 * 60 * 60
+
+
+def mark_upload_in_use(path: str):
+    """
+    Record that a session still uses its upload. Only the access time is
+    bumped: the mtime is part of file_key, so touching it would miss the cache.
+    """
+    os.utime(path, (time.time(), os.stat(path).st_mtime))
+
+
+def prune_stale_uploads():
+    """Delete uploaded CSV copies not used by any session for UPLOAD_TTL_SECONDS."""
+    cutoff = time.time() - UPLOAD_TTL_SECONDS
+    for path in glob.glob(os.path.join(UPLOAD_DIR, "*.csv")):
+        try:
+            if os.stat(path).st_atime < cutoff:
+                os.remove(path)
+        except OSError:
+            # Another session may have removed it first
+            pass
+
+
+def discard_uploaded_file():
+    """Forget the uploaded CSV and delete its temporary copy."""
+    path = st.session_state.pop("uploaded_path", None)
+    if path and os.path.isfile(path):
+        os.remove(path)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def list_csv_files():
+    """
+    CSV files in the working directory. The short TTL still picks up new
+    files without re-scanning the directory on every rerun.
+    """
+    return sorted([f for f in glob.glob("*.csv") if os.path.isfile(f)])
+
+
 # --- Load initial CSV (default or uploaded) ---
-csv_files = sorted([f for f in glob.glob("*.csv") if os.path.isfile(f)])
+csv_files = list_csv_files()
 default_csv = (
     "strategies.csv"
     if "strategies.csv" in csv_files
     else (csv_files[0] if csv_files else None)
 )
 
-if "uploaded_bytes" in st.session_state:
-    content = st.session_state["uploaded_bytes"]
-    df = load_data_from_bytes(content, bytes_md5(content), APP_VERSION)
+uploaded_path = st.session_state.get("uploaded_path")
+if uploaded_path and not os.path.isfile(uploaded_path):
+    # Swept after a day unused, or removed from the server's temp directory
+    st.session_state.pop("uploaded_path")
+    st.warning("Your uploaded CSV is no longer available, so the default dataset is shown. Upload it again to continue.")
+    uploaded_path = None
+if uploaded_path:
+    mark_upload_in_use(uploaded_path)
+    data_key = file_key(uploaded_path)
+    df = load_data_from_path(uploaded_path, data_key, APP_VERSION)
 elif default_csv:
-    df = load_data_from_path(default_csv, file_md5(default_csv), APP_VERSION)
+    data_key = file_key(default_csv)
+    df = load_data_from_path(default_csv, data_key, APP_VERSION)
 else:
+    data_key = ""
     df = pd.DataFrame(columns=REQUIRED)
 
 # ---------------- LENSES & MATURITY ----------------
@@ -230,6 +324,7 @@ MATURITY_SCALE = {
 }
 
 
+@lru_cache(maxsize=64)
 def maturity_label(avg: float) -> str:
     """
     Map the average (1–5) to the nearest official maturity level.
@@ -239,6 +334,28 @@ def maturity_label(avg: float) -> str:
     return MATURITY_SCALE[idx]
 
 
+@st.cache_data(show_spinner=False)
+def maturity_snapshot_csv(scores: tuple) -> bytes:
+    """
+    CSV export of the maturity assessment, one row per theme plus the overall
+    average. scores is a tuple of (theme, score) pairs, so the bytes are only
+    rebuilt when a maturity slider actually changes.
+    """
+    avg = sum(score for _, score in scores) / len(scores) if scores else 0
+    rows = [
+        {"Theme": name, "Score (1 to 5)": score, "Level": MATURITY_SCALE[score]}
+        for name, score in scores
+    ]
+    rows.append(
+        {
+            "Theme": "Overall (average)",
+            "Score (1 to 5)": round(avg, 2),
+            "Level": maturity_label(avg),
+        }
+    )
+    return pd.DataFrame(rows).to_csv(index=False).encode("utf-8")
+
+
 # Ten Lenses
 AXES = [
     ("Abstraction Level", "Conceptual", "Logical / Physical"),
@@ -253,19 +370,95 @@ AXES = [
     ("Decision Model", "Data-informed", "Data-driven"),
 ]
 DIMENSIONS = [a[0] for a in AXES]
+MATURITY_NAMES = [k for k, _ in MATURITY_THEMES]
+LENS_DTYPE = pd.CategoricalDtype(DIMENSIONS)
+# Direction labels per lens, indexed by np.sign(change) + 1 (left, none, right)
+DIRECTION_LABELS = np.array(
+    [(f"toward **{a[1]}**", "no change", f"toward **{a[2]}**") for a in AXES]
+)
+ACTION_DIRECTIONS = {a[0]: (f"toward {a[1]}", "no change", f"toward {a[2]}") for a in AXES}
+
 
+# Closed radar outlines (first label repeated at the end), built once
+LENS_THETA = np.array(DIMENSIONS + DIMENSIONS[:1])
+MATURITY_THETA = np.array(MATURITY_NAMES + MATURITY_NAMES[:1])
 
-def radar_trace(values01, dims, name, opacity=0.6, fill=True):
-    r = list(values01) + [values01[0]]
-    t = list(dims) + [dims[0]]
+# Radar layouts never change between reruns, so build them once
+LENS_RADAR_LAYOUT = go.Layout(
+    polar=dict(radialaxis=dict(visible=True, range=[0, 1])),
+    title="Current and target fingerprints across ten strategic lenses",
+)
+MATURITY_RADAR_LAYOUT = go.Layout(
+    polar=dict(
+        radialaxis=dict(
+            visible=True,
+            range=[0, 1],
+            tickvals=[x / 5 for x in [1, 2, 3, 4, 5]],
+            ticktext=["1", "2", "3", "4", "5"],
+        )
+    ),
+    title="Maturity profile across six themes (1 to 5 scale)",
+)
+
+
+def radar_trace(values01, theta, name, opacity=0.6, fill=True):
+    # theta is already closed (see LENS_THETA); close r to match
+    r = np.empty(len(values01) + 1)
+    r[:-1] = values01
+    r[-1] = r[0]
     return go.Scatterpolar(
-        r=r, theta=t, name=name, fill="toself" if fill else None, opacity=opacity
+        r=r, theta=theta, name=name, fill="toself" if fill else None, opacity=opacity
+    )
+
+
+@st.cache_data(show_spinner=False)
+def lens_radar(current: tuple, target: tuple) -> dict:
+    # Keyed on the slider values (0-100, in DIMENSIONS order), so reruns from
+    # other widgets reuse the figure
+    fig = go.Figure()
+    fig.add_trace(radar_trace(np.asarray(current) / 100, LENS_THETA, "Current", opacity=0.6))
+    fig.add_trace(radar_trace(np.asarray(target) / 100, LENS_THETA, "Target", opacity=0.5))
+    fig.update_layout(LENS_RADAR_LAYOUT)
+    return fig.to_dict()
+
+
+@st.cache_data(show_spinner=False)
+def maturity_gauge(avg: float) -> dict:
+    gauge_df = pd.DataFrame({"Metric": ["Maturity"], "Score": [avg]})
+    fig = px.bar(
+        gauge_df,
+        x="Metric",
+        y="Score",
+        title="Overall maturity (1 to 5)",
+        range_y=[0, 5],
     )
+    fig.update_traces(marker_color=PRIMARY)
+    fig.update_yaxes(
+        tickvals=[1, 2, 3, 4, 5],
+        ticktext=["Beginning", "Emerging", "Learning", "Developing", "Mastering"],
+        title=None,
+    )
+    fig.update_xaxes(title=None, showticklabels=False)
+    fig.update_layout(margin=dict(l=80, r=10, t=40, b=20))
+    return fig.to_dict()
+
+
+@st.cache_data(show_spinner=False)
+def maturity_radar(scores: tuple) -> dict:
+    # scores are 1–5 per theme, in MATURITY_THEMES order
+    fig = go.Figure()
+    fig.add_trace(radar_trace(np.asarray(scores) / 5, MATURITY_THETA, "Maturity", opacity=0.6))
+    fig.update_layout(MATURITY_RADAR_LAYOUT)
+    return fig.to_dict()
 
 
 def ensure_sessions():
+    # Seeded together, so one sentinel check covers every later rerun. A hard
+    # refresh clears the sentinel along with the rest of session state.
+    if "_sessions_ready" in st.session_state:
+        return
     if "_maturity_scores" not in st.session_state:
-        st.session_state["_maturity_scores"] = {k: 3 for k, _ in MATURITY_THEMES}
+        st.session_state["_maturity_scores"] = {k: 3 for k in MATURITY_NAMES}
     if "_current_scores" not in st.session_state:
         st.session_state["_current_scores"] = {d: 50 for d in DIMENSIONS}
     if "_target_scores" not in st.session_state:
@@ -280,50 +473,100 @@ def ensure_sessions():
             "questions": "",
             "capabilities": [],
         }
+    st.session_state["_sessions_ready"] = True
+
+
+# ---------------- FILTER HELPERS ----------------
+@st.cache_data(show_spinner=False)
+def filter_options(data_key: str, _df: pd.DataFrame) -> dict:
+    """
+    Sidebar filter choices, computed once per loaded dataset (keyed on
+    data_key). "year_range" is (min, max) or None. Each filter column maps
+    to its sorted non-blank "options" and "n_values", the count of all
+    distinct values (blank included), so a full selection can be skipped.
+    """
+    lo, hi = _df["year"].agg(["min", "max"])
+    out = {"year_range": (int(lo), int(hi)) if pd.notna(lo) else None}
+    for col in ["org_type", "country", "scope"]:
+        # Loaded filter columns are categorical, built from the values present,
+        # so their categories are the distinct values without another scan
+        series = _df[col]
+        values = series.cat.categories if series.dtype == "category" else series.unique()
+        out[col] = {
+            "options": sorted(v for v in values if v != ""),
+            "n_values": len(values),
+        }
+    return out
 
 
 # ---------------- SEARCH HELPERS ----------------
-def simple_search(df_in: pd.DataFrame, query: str) -> pd.DataFrame:
+# Read-only like the loaded frame, so cache_resource skips the pickle round
+# trip of a full-length Series on every search
+@st.cache_resource(show_spinner=False)
+def search_corpus(data_key: str, _df: pd.DataFrame):
     """
-    Simple case-insensitive search over key text columns.
+    Concatenated search text per row, built once per loaded dataset
+    (keyed on data_key) rather than on every keystroke. Case-folded up
+    front and stored as a categorical so rows sharing the same text are
+    searched once.
     """
-    if not query:
-        return df_in
+    text = _df["title"].astype(str)
+    for col in ["organisation", "summary", "scope"]:
+        text = text + " " + _df[col].astype(str)
+    return text.str.casefold().astype("category")
 
-    text_cols = [c for c in ["title", "organisation", "summary", "scope"] if c in df_in.columns]
-    if not text_cols:
-        return df_in
 
-    text = df_in[text_cols[0]].astype(str)
-    for col in text_cols[1:]:
-        text = text + " " + df_in[col].astype(str)
+def keyword_mask(corpus, query: str, candidates=None) -> np.ndarray:
+    """
+    Case-insensitive keyword search as a boolean mask over the full dataset,
+    so it can be combined with the sidebar filters before slicing.
+    corpus is the cached output of search_corpus; candidates is an optional
+    row mask from cheaper filters, and only texts of those rows are tested.
+    """
+    texts = corpus.cat.categories
+    codes = corpus.cat.codes.to_numpy()
+    live = np.unique(codes[candidates]) if candidates is not None else np.arange(len(texts))
 
-    mask = text.str.contains(query, case=False, na=False)
-    return df_in[mask]
+    # Plain substring test on each distinct, already case-folded text (no
+    # regex compile, no per-call upper-casing, and queries such as
+    # "data (ethics" no longer raise), then broadcast back to rows through
+    # the category codes.
+    needle = query.casefold()
+    hits = np.zeros(len(texts), dtype=bool)
+    hits[live] = [needle in text for text in texts[live]]
+    return hits[codes]
 
 
 @st.cache_resource(show_spinner=False)
 def get_embedding_model():
     if not HAS_EMBED:
         return None
+    try:
+        from sentence_transformers import SentenceTransformer
+    except Exception:
+        return None
     return SentenceTransformer("all-MiniLM-L6-v2")
 
 
 @st.cache_data(show_spinner=False)
-def compute_strategy_embeddings(df_in: pd.DataFrame, app_version: str):
+def compute_strategy_embeddings(data_key: str, _df_in: pd.DataFrame, app_version: str):
+    """
+    Row embeddings for semantic search, computed on first use per loaded
+    dataset (keyed on data_key rather than by hashing the frame).
+    """
     if not HAS_EMBED:
         return None
     model = get_embedding_model()
     if model is None:
         return None
 
-    text_cols = [c for c in ["title", "organisation", "summary", "scope", "country"] if c in df_in.columns]
+    text_cols = [c for c in ["title", "organisation", "summary", "scope", "country"] if c in _df_in.columns]
     if not text_cols:
         return None
 
-    texts = df_in[text_cols[0]].astype(str)
+    texts = _df_in[text_cols[0]].astype(str)
     for col in text_cols[1:]:
-        texts = texts + " " + df_in[col].astype(str)
+        texts = texts + " " + _df_in[col].astype(str)
 
     embeddings = model.encode(
         texts.tolist(),
@@ -331,7 +574,7 @@ def compute_strategy_embeddings(df_in: pd.DataFrame, app_version: str):
         convert_to_numpy=True,
         normalize_embeddings=True,
     )
-    emb_df = pd.DataFrame(embeddings, index=df_in.index)
+    emb_df = pd.DataFrame(embeddings, index=_df_in.index)
     return emb_df
 
 
@@ -351,176 +594,469 @@ def semantic_search(fdf: pd.DataFrame, emb_df: pd.DataFrame, query: str, top_k:
     sub_emb = emb_df.loc[fdf.index].values
     sims = sub_emb @ q_emb
 
-    order = np.argsort(-sims)
-    order = order[: min(top_k, len(order))]
+    # Select the top_k scores in linear time, then sort only those
+    k = min(top_k, len(sims))
+    order = np.argpartition(-sims, k - 1)[:k]
+    order = order[np.argsort(-sims[order])]
     result = fdf.iloc[order].copy()
     result["similarity"] = sims[order]
     return result
 
 
-emb_df = compute_strategy_embeddings(df, APP_VERSION)
-
 # ---------------- HINTS & CONFLICTS ----------------
+# Maturity level -> hint band
+HINT_BANDS = {
+    "Beginning": "low",
+    "Emerging": "low",
+    "Learning": "mid",
+    "Developing": "mid",
+    "Mastering": "high",
+}
+
+# lens -> band -> contextual hint shown under each lens in Diagnose
+LENS_HINTS = {
+    "Governance Structure": {
+        "low": "At Beginning or Emerging, stronger central coordination usually works best before moving to federated models.",
+        "mid": "At Learning or Developing, you can gradually federate while keeping common standards and shared services.",
+        "high": "At Mastering, federation can unlock autonomy, but guard against fragmentation with shared guardrails.",
+    },
+    "Delivery Mode": {
+        "low": "Favour incremental delivery to build confidence and reduce risk; avoid a single big bang change.",
+        "mid": "Blend incremental delivery with a few larger change packages where foundations are solid.",
+        "high": "At Mastering, big bang change is possible, but only with strong programme discipline and clear benefits.",
+    },
+    "Access Philosophy": {
+        "low": "Start with role based access to a small number of trusted datasets before opening up more widely.",
+        "mid": "Broaden access with good catalogue and search, and keep tight controls around sensitive domains.",
+        "high": "Push democratisation further, but make sure data protection and audit trails stay robust.",
+    },
+    "Decision Model": {
+        "low": "Data informed decisions with clear human oversight are safest while skills and quality are still building.",
+        "mid": "Increase automation in low risk areas and keep humans in the loop for high impact decisions.",
+        "high": "Mastering organisations can rely more on data driven decisions, with strong monitoring and fallback plans.",
+    },
+    "Motivation": {
+        "low": "Keep compliance at the core while you pilot innovation in tightly scoped sandboxes.",
+        "mid": "Balance compliance and innovation; use proof of concepts to justify broader change.",
+        "high": "At Mastering, innovation and compliance can reinforce each other through governance by design.",
+    },
+    "Ambition": {
+        "low": "Focus on essentials such as data quality, governance and core platforms before promising transformational change.",
+        "mid": "You can mix foundational work with some transformational strands where benefits are clear.",
+        "high": "Aim for transformational impact but keep benefits and operating model changes clearly articulated.",
+    },
+    "Coverage": {
+        "low": "Use a few high impact use cases to prove value while you build broader capabilities.",
+        "mid": "Begin to spread capabilities horizontally to avoid islands of excellence.",
+        "high": "Horizontal coverage makes sense, but choose a few flagship use cases to anchor the narrative.",
+    },
+    "Orientation": {
+        "low": "Platform and tooling investments will dominate early; link them clearly to outcomes.",
+        "mid": "Balance platform work with visible value; avoid technology for its own sake.",
+        "high": "Keep value firmly in the lead, with platforms treated as enablers rather than ends.",
+    },
+    "Adaptability": {
+        "low": "Keep a stable core with a small living layer; too much churn can confuse people.",
+        "mid": "Treat the strategy as living and schedule periodic reviews and small course corrections.",
+        "high": "Mastering organisations can iterate often, as long as changes are well governed and communicated.",
+    },
+    "Abstraction Level": {
+        "low": "Keep the strategy concise and vision led, but quickly translate it into practical roadmaps and controls.",
+        "mid": "Balance vision with enough logical detail to guide delivery teams.",
+        "high": "You can afford a more detailed logical or physical description, but avoid over specifying too early.",
+    },
+}
+
+
 def hint_for_lens(lens_name, maturity_avg, maturity_level_name=None):
     """
     Give contextual hints based on the organisation's overall maturity level.
     Uses government levels: Beginning, Emerging, Learning, Developing, Mastering.
     """
-    level = maturity_level_name or maturity_label(maturity_avg)
-    low = level in ("Beginning", "Emerging")
-    mid = level in ("Learning", "Developing")
-    high = level == "Mastering"
-
-    if lens_name == "Governance Structure":
-        if low:
-            return "At Beginning or Emerging, stronger central coordination usually works best before moving to federated models."
-        if mid:
-            return "At Learning or Developing, you can gradually federate while keeping common standards and shared services."
-        if high:
-            return "At Mastering, federation can unlock autonomy, but guard against fragmentation with shared guardrails."
-    if lens_name == "Delivery Mode":
-        if low:
-            return "Favour incremental delivery to build confidence and reduce risk; avoid a single big bang change."
-        if mid:
-            return "Blend incremental delivery with a few larger change packages where foundations are solid."
-        if high:
-            return "At Mastering, big bang change is possible, but only with strong programme discipline and clear benefits."
-    if lens_name == "Access Philosophy":
-        if low:
-            return "Start with role based access to a small number of trusted datasets before opening up more widely."
-        if mid:
-            return "Broaden access with good catalogue and search, and keep tight controls around sensitive domains."
-        if high:
-            return "Push democratisation further, but make sure data protection and audit trails stay robust."
-    if lens_name == "Decision Model":
-        if low:
-            return "Data informed decisions with clear human oversight are safest while skills and quality are still building."
-        if mid:
-            return "Increase automation in low risk areas and keep humans in the loop for high impact decisions."
-        if high:
-            return "Mastering organisations can rely more on data driven decisions, with strong monitoring and fallback plans."
-    if lens_name == "Motivation":
-        if low:
-            return "Keep compliance at the core while you pilot innovation in tightly scoped sandboxes."
-        if mid:
-            return "Balance compliance and innovation; use proof of concepts to justify broader change."
-        if high:
-            return "At Mastering, innovation and compliance can reinforce each other through governance by design."
-    if lens_name == "Ambition":
-        if low:
-            return "Focus on essentials such as data quality, governance and core platforms before promising transformational change."
-        if mid:
-            return "You can mix foundational work with some transformational strands where benefits are clear."
-        if high:
-            return "Aim for transformational impact but keep benefits and operating model changes clearly articulated."
-    if lens_name == "Coverage":
-        if low:
-            return "Use a few high impact use cases to prove value while you build broader capabilities."
-        if mid:
-            return "Begin to spread capabilities horizontally to avoid islands of excellence."
-        if high:
-            return "Horizontal coverage makes sense, but choose a few flagship use cases to anchor the narrative."
-    if lens_name == "Orientation":
-        if low:
-            return "Platform and tooling investments will dominate early; link them clearly to outcomes."
-        if mid:
-            return "Balance platform work with visible value; avoid technology for its own sake."
-        if high:
-            return "Keep value firmly in the lead, with platforms treated as enablers rather than ends."
-    if lens_name == "Adaptability":
-        if low:
-            return "Keep a stable core with a small living layer; too much churn can confuse people."
-        if mid:
-            return "Treat the strategy as living and schedule periodic reviews and small course corrections."
-        if high:
-            return "Mastering organisations can iterate often, as long as changes are well governed and communicated."
-    if lens_name == "Abstraction Level":
-        if low:
-            return "Keep the strategy concise and vision led, but quickly translate it into practical roadmaps and controls."
-        if mid:
-            return "Balance vision with enough logical detail to guide delivery teams."
-        if high:
-            return "You can afford a more detailed logical or physical description, but avoid over specifying too early."
-
-    return ""
-
-
-def conflict_for_target(lens_name, target_score, maturity_avg):
+    band = HINT_BANDS.get(maturity_level_name or maturity_label(maturity_avg))
+    return LENS_HINTS.get(lens_name, {}).get(band, "")
+
+
+# Maturity level -> conflict band. Learning is treated as middle (no band).
+CONFLICT_BANDS = {
+    "Beginning": "low",
+    "Emerging": "low",
+    "Developing": "high",
+    "Mastering": "high",
+}
+
+# (lens, band) -> (test on the 0–100 target score, warning). Low maturity
+# warns about very ambitious or risky targets; higher maturity about overly
+# conservative ones.
+CONFLICT_RULES = {
+    ("Delivery Mode", "low"): (
+        lambda s: s >= 70,
+        "Big bang delivery at Beginning or Emerging maturity is high risk. Consider phased delivery.",
+    ),
+    ("Governance Structure", "low"): (
+        lambda s: s <= 30,
+        "Highly federated models at low maturity can fragment standards. Strengthen central controls first.",
+    ),
+    ("Access Philosophy", "low"): (
+        lambda s: s <= 30,
+        "Wide democratisation needs strong basics. Start with controlled, role based access.",
+    ),
+    ("Decision Model", "low"): (
+        lambda s: s >= 70,
+        "Highly data driven decisions need robust data quality, monitoring and skills.",
+    ),
+    ("Motivation", "low"): (
+        lambda s: s >= 70,
+        "Innovation first without guardrails can raise risk. Keep compliance in the loop.",
+    ),
+    ("Delivery Mode", "high"): (
+        lambda s: s <= 30,
+        "At Developing or Mastering, being too incremental may under deliver benefits.",
+    ),
+    ("Governance Structure", "high"): (
+        lambda s: s >= 80,
+        "Highly centralised models may slow teams at higher maturity. Consider selective federation.",
+    ),
+    ("Access Philosophy", "high"): (
+        lambda s: s >= 80,
+        "Excessive control may limit value realisation. Revisit openness where safe.",
+    ),
+}
+
+
+def conflict_for_target(lens_name, target_score, maturity_avg, maturity_level_name=None):
     """
     Flag misalignments between maturity and ambitious targets.
     target_score is 0–100 toward right label.
     """
-    level = maturity_label(maturity_avg)
-    low = level in ("Beginning", "Emerging")
-    highish = level in ("Developing", "Mastering")  # treat Learning as middle
-
-    # Low maturity: warn if target is very ambitious or risky
-    if low:
-        if lens_name == "Delivery Mode" and target_score >= 70:
-            return "Big bang delivery at Beginning or Emerging maturity is high risk. Consider phased delivery."
-        if lens_name == "Governance Structure" and target_score <= 30:
-            return "Highly federated models at low maturity can fragment standards. Strengthen central controls first."
-        if lens_name == "Access Philosophy" and target_score <= 30:
-            return "Wide democratisation needs strong basics. Start with controlled, role based access."
-        if lens_name == "Decision Model" and target_score >= 70:
-            return "Highly data driven decisions need robust data quality, monitoring and skills."
-        if lens_name == "Motivation" and target_score >= 70:
-            return "Innovation first without guardrails can raise risk. Keep compliance in the loop."
-
-    # Higher maturity: warn if overly conservative
-    if highish:
-        if lens_name == "Delivery Mode" and target_score <= 30:
-            return "At Developing or Mastering, being too incremental may under deliver benefits."
-        if lens_name == "Governance Structure" and target_score >= 80:
-            return "Highly centralised models may slow teams at higher maturity. Consider selective federation."
-        if lens_name == "Access Philosophy" and target_score >= 80:
-            return "Excessive control may limit value realisation. Revisit openness where safe."
-
+    band = CONFLICT_BANDS.get(maturity_level_name or maturity_label(maturity_avg))
+    rule = CONFLICT_RULES.get((lens_name, band))
+    if rule and rule[0](target_score):
+        return rule[1]
     return None
 
 
+# ---------------- SHIFT GAP ANALYSIS ----------------
+@st.cache_data(show_spinner=False)
+def gap_table(current: tuple, target: tuple, m_avg: float) -> pd.DataFrame:
+    """
+    Per-lens gap between current and target positions (0–100 scores in
+    DIMENSIONS order), conflicts first and then by size of move. Cached on
+    the slider values so reruns from other widgets reuse it.
+    """
+    cur = np.array(current, dtype=np.int16)
+    tgt = np.array(target, dtype=np.int16)
+    diff = tgt - cur
+    level = maturity_label(m_avg)
+    notes = np.array(
+        [conflict_for_target(d, t, m_avg, level) or "" for d, t in zip(DIMENSIONS, tgt)],
+        dtype=object,
+    )
+    return pd.DataFrame(
+        {
+            "Lens": DIMENSIONS,
+            "Current": cur,
+            "Target": tgt,
+            "Change needed": diff,
+            "Magnitude": np.abs(diff),
+            "Direction": DIRECTION_LABELS[np.arange(len(diff)), np.sign(diff) + 1],
+            "Conflict": notes.astype(bool),
+            "Conflict note": notes,
+        }
+    ).astype(
+        # Fixed label sets: stored as small integer codes
+        {"Lens": LENS_DTYPE, "Direction": "category"}
+    ).sort_values(["Conflict", "Magnitude"], ascending=[False, False])
+
+
+GAP_BAR_LAYOUT = go.Layout(
+    title="Signed change needed (negative means move left, positive means move right)",
+    xaxis_title="Change needed",
+    yaxis_title="Lens",
+    barmode="relative",
+)
+
+
+@st.cache_data(show_spinner=False)
+def gap_bar(gap_df: pd.DataFrame) -> dict:
+    ordered = gap_df.sort_values("Change needed")
+    # Colours follow the sorted rows so each bar keeps its own conflict flag
+    colors = np.where(ordered["Conflict"].to_numpy(), RED, PRIMARY)
+    bar = go.Figure(
+        go.Bar(
+            x=ordered["Change needed"].to_numpy(),
+            y=ordered["Lens"].astype(str).to_numpy(),
+            orientation="h",
+            marker_color=colors,
+            hovertemplate="Change needed=%{x}<br>Lens=%{y}<extra></extra>",
+        ),
+        layout=GAP_BAR_LAYOUT,
+    )
+    return bar.to_dict()
+
+
 # ---------------- EXPLORE CHARTS ----------------
-def render_explore_charts(fdf: pd.DataFrame):
+# Explore caches are keyed on the filtered rows or their counts, so every new
+# search or filter combination adds an entry; keep only the most recent ones
+EXPLORE_CACHE_ENTRIES = 32
+
+
+@st.cache_data(show_spinner=False, max_entries=EXPLORE_CACHE_ENTRIES)
+def explore_aggregates(data_key: str, rows: np.ndarray, _fdf: pd.DataFrame) -> dict:
+    """
+    KPI values and grouped counts for the Explore charts, cached per loaded
+    dataset (data_key) and filtered row set (rows, the index labels of
+    _fdf), so reruns that leave the filters unchanged skip the groupbys.
+    """
+    agg = {"n": len(_fdf), "year_span": None}
+    if "year" in _fdf.columns:
+        # min and max in one pass; both NA when no row has a year
+        lo, hi = _fdf["year"].agg(["min", "max"])
+        if pd.notna(lo):
+            agg["year_span"] = (int(lo), int(hi))
+    for col in ("org_type", "country", "scope"):
+        if col in _fdf.columns:
+            # Sorted by count already; drop unused categories, which a
+            # categorical's value_counts still lists with zero
+            counts = _fdf[col].value_counts()
+            agg[col] = counts[counts > 0]
+    # Distinct counts fall out of the value counts (one entry per value)
+    agg["n_org_types"] = len(agg.get("org_type", ()))
+    agg["n_countries"] = len(agg.get("country", ()))
+    if all(col in _fdf.columns for col in ["country", "org_type"]):
+        # One row per (country, org_type, organisation) instead of per strategy
+        agg["tree"] = _fdf.groupby(
+            ["country", "org_type", "organisation"], observed=True
+        ).size().reset_index(name="_value")
+        agg["top_countries"] = agg["country"].head(12).index.tolist()
+        # org_type x country counts for the stacked bar, in order of appearance
+        top = _fdf[_fdf["country"].isin(agg["top_countries"])]
+        agg["country_org"] = (
+            top.groupby(["org_type", "country"], observed=True)
+            .size()
+            .unstack(fill_value=0)
+            .reindex(
+                index=top["org_type"].unique().tolist(),
+                columns=top["country"].unique().tolist(),
+            )
+        )
+    if agg["year_span"]:
+        # Year histogram pre-binned per scope on shared, whole-year bins
+        # centred on each year; spans over 40 years get multi-year bins
+        dated = _fdf[_fdf["year"].notna()]
+        lo, hi = agg["year_span"]
+        width = -(-(hi - lo + 1) // 40)
+        edges = np.arange(lo, hi + width + 1, width) - 0.5
+        if "scope" in dated.columns:
+            groups = dated.groupby("scope", observed=True, sort=False)["year"]
+        else:
+            groups = [("", dated["year"])]
+        agg["year_hist"] = (
+            edges,
+            {name: np.histogram(y.to_numpy(dtype=float), edges)[0] for name, y in groups},
+        )
+    return agg
+
+
+# Figure builders take small count tuples so repeat reruns with the same
+# filtered counts return the cached figure dict instead of rebuilding it.
+@st.cache_data(show_spinner=False, max_entries=EXPLORE_CACHE_ENTRIES)
+def org_type_bar(org_counts: tuple) -> dict:
+    top_org = pd.DataFrame(list(org_counts), columns=["org_type", "count"]).sort_values(
+        "count", ascending=False
+    )
+    fig = go.Figure(
+        go.Bar(x=top_org["org_type"].to_numpy(), y=top_org["count"].to_numpy())
+    )
+    fig.update_layout(title="Composition by organisation type", yaxis_title="count")
+    fig.update_xaxes(title=None, tickangle=20)
+    return fig.to_dict()
+
+
+# ISO-3 codes for country names seen in strategy catalogues; anything not
+# listed falls back to plotly's own country-name matching
+COUNTRY_ISO3 = {
+    "uk": "GBR",
+    "united kingdom": "GBR",
+    "great britain": "GBR",
+    "england": "GBR",
+    "scotland": "GBR",
+    "wales": "GBR",
+    "northern ireland": "GBR",
+    "ireland": "IRL",
+    "us": "USA",
+    "usa": "USA",
+    "united states": "USA",
+    "united states of america": "USA",
+    "canada": "CAN",
+    "australia": "AUS",
+    "new zealand": "NZL",
+    "france": "FRA",
+    "germany": "DEU",
+    "netherlands": "NLD",
+    "belgium": "BEL",
+    "denmark": "DNK",
+    "norway": "NOR",
+    "sweden": "SWE",
+    "finland": "FIN",
+    "estonia": "EST",
+    "spain": "ESP",
+    "italy": "ITA",
+    "singapore": "SGP",
+    "india": "IND",
+    "japan": "JPN",
+    "south korea": "KOR",
+}
+
+
+@st.cache_data(show_spinner=False, max_entries=EXPLORE_CACHE_ENTRIES)
+def country_map(country_counts: tuple) -> dict:
+    # location -> [spellings, total]; several spellings ("UK", "England",
+    # "Scotland") resolve to the same code and must share one shape
+    by_mode = {"ISO-3": {}, "country names": {}}
+    for country, count in country_counts:
+        if not country:
+            continue
+        code = COUNTRY_ISO3.get(country.strip().lower())
+        entry = by_mode["ISO-3" if code else "country names"].setdefault(
+            code or country, [[], 0]
+        )
+        entry[0].append(country)
+        entry[1] += count
+    # Both traces share one colour axis so the scale stays consistent
+    traces = [
+        go.Choropleth(
+            locations=list(locs),
+            z=np.array([total for _, total in locs.values()], dtype=np.uint32),
+            text=[", ".join(names) for names, _ in locs.values()],
+            locationmode=mode,
+            coloraxis="coloraxis",
+            hovertemplate="%{text}<br>count=%{z}<extra></extra>",
+        )
+        for mode, locs in by_mode.items()
+        if locs
+    ]
+    fig = go.Figure(traces)
+    fig.update_layout(
+        title="Global distribution of strategies (by country)",
+        coloraxis={"colorscale": "Blues", "colorbar": {"title": {"text": "count"}}},
+    )
+    return fig.to_dict()
+
+
+@st.cache_data(show_spinner=False, max_entries=EXPLORE_CACHE_ENTRIES)
+def scope_pie(scope_counts: tuple) -> dict:
+    labels, values = zip(*scope_counts) if scope_counts else ((), ())
+    fig = go.Figure(go.Pie(labels=labels, values=values))
+    fig.update_layout(title="Strategy scope breakdown")
+    return fig.to_dict()
+
+
+@st.cache_data(show_spinner=False, max_entries=EXPLORE_CACHE_ENTRIES)
+def year_histogram(edges: tuple, scope_hists: tuple) -> dict:
+    # edges sit half a year either side of whole years (see explore_aggregates)
+    edges = np.asarray(edges)
+    centres = (edges[:-1] + edges[1:]) / 2
+    first = (edges[:-1] + 0.5).astype(int)
+    last = (edges[1:] - 0.5).astype(int)
+    spans = np.char.add(np.char.add(first.astype(str), "–"), last.astype(str))
+    labels = np.where(first == last, first.astype(str), spans)
+    fig = go.Figure(
+        [
+            go.Bar(
+                x=centres,
+                y=np.asarray(hist),
+                name=name,
+                customdata=labels,
+                hovertemplate="%{customdata}: %{y}",
+            )
+            for name, hist in scope_hists
+        ]
+    )
+    fig.update_layout(
+        title="Strategies by year",
+        barmode="stack",
+        bargap=0.05,
+        xaxis_title="year",
+        yaxis_title="count",
+        legend_title_text="scope",
+    )
+    return fig.to_dict()
+
+
+@st.cache_data(show_spinner=False, max_entries=EXPLORE_CACHE_ENTRIES)
+def landscape_treemap(tree_rows: tuple) -> dict:
+    tree = pd.DataFrame(
+        list(tree_rows), columns=["country", "org_type", "organisation", "_value"]
+    )
+    fig = px.treemap(
+        tree,
+        path=["country", "org_type", "organisation"],
+        values="_value",
+        title="Landscape by country, organisation type and organisation",
+    )
+    return fig.to_dict()
+
+
+@st.cache_data(show_spinner=False, max_entries=EXPLORE_CACHE_ENTRIES)
+def country_org_stack(countries: tuple, org_rows: tuple) -> dict:
+    fig = go.Figure(
+        [go.Bar(name=org, x=list(countries), y=np.asarray(row)) for org, row in org_rows]
+    )
+    fig.update_layout(
+        title="Top countries by strategies (stacked by organisation type)",
+        barmode="stack",
+        yaxis_title="count",
+        legend_title_text="org_type",
+    )
+    fig.update_xaxes(title=None)
+    return fig.to_dict()
+
+
+@st.cache_data(show_spinner=False, max_entries=EXPLORE_CACHE_ENTRIES)
+def timeline_scatter(data_key: str, rows: np.ndarray, _fdf: pd.DataFrame) -> dict:
+    # One point per strategy, so keyed on the filtered row set like explore_aggregates
+    sub = _fdf[_fdf["year"].notna()]
+    fig = px.scatter(
+        sub,
+        x="year",
+        y="organisation",
+        color="country" if "country" in sub.columns else None,
+        hover_data=["title", "country", "scope"]
+        if "scope" in sub.columns
+        else ["title"],
+        title="Timeline of strategies by organisation",
+    )
+    return fig.to_dict()
+
+
+def render_explore_charts(data_key: str, fdf: pd.DataFrame):
+    counts = explore_aggregates(data_key, fdf.index.to_numpy(), fdf)
+
     st.markdown("## Explore the strategic landscape")
     k1, k2, k3, k4 = st.columns(4)
-    k1.metric("Strategies", len(fdf))
-    k2.metric("Countries", fdf["country"].nunique() if "country" in fdf.columns else 0)
-    k3.metric("Org types", fdf["org_type"].nunique() if "org_type" in fdf.columns else 0)
-    if "year" in fdf.columns and fdf["year"].notna().any():
-        k4.metric("Year span", f"{int(fdf['year'].min())}-{int(fdf['year'].max())}")
+    k1.metric("Strategies", counts["n"])
+    k2.metric("Countries", counts["n_countries"])
+    k3.metric("Org types", counts["n_org_types"])
+    if counts["year_span"]:
+        k4.metric("Year span", "{}-{}".format(*counts["year_span"]))
     else:
         k4.metric("Year span", "n a")
 
     st.markdown("---")
     c1, c2 = st.columns(2)
 
-    if "year" in fdf.columns and fdf["year"].notna().any():
-        fig_hist = px.histogram(
-            fdf[fdf["year"].notna()],
-            x="year",
-            color="scope" if "scope" in fdf.columns else None,
-            nbins=max(10, min(40, fdf["year"].nunique())),
-            title="Strategies by year",
+    if counts["year_span"]:
+        edges, by_scope = counts["year_hist"]
+        fig_hist = year_histogram(
+            tuple(edges), tuple((name, tuple(hist)) for name, hist in by_scope.items())
         )
-        fig_hist.update_layout(bargap=0.05)
         c1.plotly_chart(fig_hist, use_container_width=True)
     else:
         c1.info("No numeric 'year' values to chart. Check your CSV or filters.")
 
     if "org_type" in fdf.columns and fdf["org_type"].notna().any():
-        top_org = (
-            fdf.groupby("org_type")
-            .size()
-            .reset_index(name="count")
-            .sort_values("count", ascending=False)
-        )
-        fig_org = px.bar(
-            top_org,
-            x="org_type",
-            y="count",
-            title="Composition by organisation type",
-        )
-        fig_org.update_xaxes(title=None, tickangle=20)
+        fig_org = org_type_bar(tuple(counts["org_type"].items()))
         c2.plotly_chart(fig_org, use_container_width=True)
     else:
         c2.info("No 'org_type' values to chart.")
@@ -530,11 +1066,8 @@ def render_explore_charts(fdf: pd.DataFrame):
 
     if all(col in fdf.columns for col in ["country", "org_type"]):
         if not fdf.empty:
-            fig_tree = px.treemap(
-                fdf.assign(_value=1),
-                path=["country", "org_type", "organisation"],
-                values="_value",
-                title="Landscape by country, organisation type and organisation",
+            fig_tree = landscape_treemap(
+                tuple(counts["tree"].itertuples(index=False, name=None))
             )
             c3.plotly_chart(fig_tree, use_container_width=True)
         else:
@@ -543,16 +1076,8 @@ def render_explore_charts(fdf: pd.DataFrame):
         c3.info("Need 'country' and 'org_type' columns for treemap.")
 
     if "country" in fdf.columns and fdf["country"].notna().any():
-        by_ctry = fdf.groupby("country").size().reset_index(name="count")
-        if not by_ctry.empty:
-            fig_map = px.choropleth(
-                by_ctry,
-                locations="country",
-                locationmode="country names",
-                color="count",
-                title="Global distribution of strategies (by country)",
-                color_continuous_scale="Blues",
-            )
+        if not counts["country"].empty:
+            fig_map = country_map(tuple(counts["country"].items()))
             c4.plotly_chart(fig_map, use_container_width=True)
         else:
             c4.info("No country counts to map.")
@@ -562,18 +1087,12 @@ def render_explore_charts(fdf: pd.DataFrame):
     st.markdown("---")
     c5, c6 = st.columns(2)
     if all(col in fdf.columns for col in ["country", "org_type"]):
-        top_ctrys = (
-            fdf.groupby("country").size().sort_values(ascending=False).head(12).index.tolist()
-        )
-        sub = fdf[fdf["country"].isin(top_ctrys)]
-        if not sub.empty:
-            fig_stack = px.bar(
-                sub,
-                x="country",
-                color="org_type",
-                title="Top countries by strategies (stacked by organisation type)",
+        stack = counts["country_org"]
+        if not stack.empty:
+            fig_stack = country_org_stack(
+                tuple(stack.columns),
+                tuple((org, tuple(row)) for org, row in zip(stack.index, stack.to_numpy())),
             )
-            fig_stack.update_xaxes(title=None)
             c5.plotly_chart(fig_stack, use_container_width=True)
         else:
             c5.info("No data for stacked bar.")
@@ -582,31 +1101,58 @@ def render_explore_charts(fdf: pd.DataFrame):
 
     needed = ["year", "organisation", "title"]
     if all(col in fdf.columns for col in needed) and fdf["year"].notna().any():
-        sub = fdf[fdf["year"].notna()].copy()
-        fig_scatter = px.scatter(
-            sub,
-            x="year",
-            y="organisation",
-            color="country" if "country" in sub.columns else None,
-            hover_data=["title", "country", "scope"]
-            if "scope" in sub.columns
-            else ["title"],
-            title="Timeline of strategies by organisation",
-        )
+        fig_scatter = timeline_scatter(data_key, fdf.index.to_numpy(), fdf)
         c6.plotly_chart(fig_scatter, use_container_width=True)
     else:
         c6.info("Need 'year', 'organisation' and 'title' columns for timeline.")
 
     st.markdown("---")
     if "scope" in fdf.columns and fdf["scope"].notna().any():
-        by_scope = fdf["scope"].value_counts().reset_index()
-        by_scope.columns = ["scope", "count"]
-        fig_scope = px.pie(
-            by_scope, names="scope", values="count", title="Strategy scope breakdown"
-        )
+        fig_scope = scope_pie(tuple(counts["scope"].items()))
         st.plotly_chart(fig_scope, use_container_width=True)
 
 
+# ---------------- RESEARCH CARDS ----------------
+def render_resource_cards(resources, cols_per_row=3):
+    for i in range(0, len(resources), cols_per_row):
+        row_items = resources[i : i + cols_per_row]
+        cols = st.columns(len(row_items))
+        for col, (title, desc, url) in zip(cols, row_items):
+            with col:
+                st.markdown(
+                    f"""
+                    <div style="
+                        background-color: #1e293b;
+                        border-radius: 12px;
+                        padding: 16px 16px 14px 16px;
+                        margin-bottom: 12px;
+                        box-shadow: 0 4px 12px rgba(15, 23, 42, 0.35);
+                        border: 1px solid rgba(148, 163, 184, 0.4);
+                    ">
+                        <div style="font-weight: 600; font-size: 0.95rem; color: #e5e7eb; margin-bottom: 6px;">
+                            {title}
+                        </div>
+                        <div style="font-size: 0.85rem; color: #cbd5f5; margin-bottom: 10px;">
+                            {desc}
+                        </div>
+                        <a href="{url}" target="_blank" style="
+                            display: inline-flex;
+                            align-items: center;
+                            gap: 6px;
+                            font-size: 0.85rem;
+                            font-weight: 500;
+                            color: #38bdf8;
+                            text-decoration: none;
+                        ">
+                            <span>Open resource</span>
+                            <span style="font-size: 0.9rem;">↗</span>
+                        </a>
+                    </div>
+                    """,
+                    unsafe_allow_html=True,
+                )
+
+
 # ---------------- TABS SETUP ----------------
 ensure_sessions()
 tab_home, tab_explore, tab_diagnose, tab_shift, tab_actions, tab_research, tab_about = st.tabs(
@@ -784,9 +1330,7 @@ with tab_explore:
         st.caption("CSV must include required columns such as id, title and organisation.")
         st.markdown("---")
 
-        csv_files_local = sorted(
-            [f for f in glob.glob("*.csv") if os.path.isfile(f)]
-        )
+        csv_files_local = list_csv_files()
         if csv_files_local:
             default_csv_local = (
                 "strategies.csv"
@@ -799,15 +1343,15 @@ with tab_explore:
                 index=csv_files_local.index(default_csv_local),
             )
             if st.button("Load selected file"):
-                st.session_state.pop("uploaded_bytes", None)
-                st.cache_data.clear()
+                discard_uploaded_file()
+                clear_data_caches()
                 try:
-                    df_new = load_data_from_path(
-                        sel, file_md5(sel), APP_VERSION
-                    )
+                    sel_key = file_key(sel)
+                    df_new = load_data_from_path(sel, sel_key, APP_VERSION)
                     df = df_new
+                    data_key = sel_key
                     st.success(
-                        f"Loaded {sel} ({len(df)} rows, MD5 {file_md5(sel)[:12]}...)"
+                        f"Loaded {sel} ({len(df)} rows)"
                     )
                 except Exception as e:
                     st.error(f"Error loading file: {e}")
@@ -816,45 +1360,51 @@ with tab_explore:
 
         cols_reload = st.columns(2)
         if cols_reload[0].button("Reload (clear cache)"):
-            st.cache_data.clear()
+            clear_data_caches()
             st.rerun()
         if cols_reload[1].button("Hard refresh (cache and state)"):
-            st.cache_data.clear()
+            discard_uploaded_file()
+            clear_data_caches()
             for k in list(st.session_state.keys()):
                 del st.session_state[k]
             st.rerun()
 
-        if uploaded is not None:
-            content = uploaded.read()
+        # The uploader keeps its file across reruns; only handle a new one
+        if uploaded is not None and uploaded.file_id != st.session_state.get("uploaded_file_id"):
+            st.session_state["uploaded_file_id"] = uploaded.file_id
+            # Spool to disk so the bytes live outside session state and the
+            # upload goes through the same cached path loader as local files
+            os.makedirs(UPLOAD_DIR, exist_ok=True)
+            prune_stale_uploads()
+            with tempfile.NamedTemporaryFile(delete=False, suffix=".csv", dir=UPLOAD_DIR) as tmp:
+                tmp.write(uploaded.getbuffer())
+            clear_data_caches()
             try:
-                df_new = load_data_from_bytes(content, bytes_md5(content), APP_VERSION)
-                st.session_state["uploaded_bytes"] = content
-                st.cache_data.clear()
+                df_new = load_data_from_path(tmp.name, file_key(tmp.name), APP_VERSION)
+                discard_uploaded_file()
+                st.session_state["uploaded_path"] = tmp.name
                 st.success(f"Loaded uploaded CSV ({len(df_new)} rows)")
                 st.rerun()
             except Exception as e:
+                os.remove(tmp.name)
                 st.error(f"Upload error: {e}")
 
     with st.sidebar:
         st.subheader("Filters for Explore tab")
-        years = sorted(y for y in df["year"].dropna().unique())
-        if years:
-            yr = st.slider(
-                "Year range",
-                int(min(years)),
-                int(max(years)),
-                (int(min(years)), int(max(years))),
-            )
+        opts = filter_options(data_key, df)
+        if opts["year_range"]:
+            yr_min, yr_max = opts["year_range"]
+            yr = st.slider("Year range", yr_min, yr_max, (yr_min, yr_max))
         else:
             yr = None
 
-        org_types = sorted([v for v in df["org_type"].unique() if v != ""])
+        org_types = opts["org_type"]["options"]
         org_type_sel = st.multiselect("Organisation type", org_types, default=org_types)
 
-        countries = sorted([v for v in df["country"].unique() if v != ""])
+        countries = opts["country"]["options"]
         country_sel = st.multiselect("Country", countries, default=countries)
 
-        scopes = sorted([v for v in df["scope"].unique() if v != ""])
+        scopes = opts["scope"]["options"]
         scope_sel = st.multiselect("Scope", scopes, default=scopes)
 
         q = st.text_input(
@@ -865,28 +1415,40 @@ with tab_explore:
         search_mode = st.radio(
             "Search mode",
             options=["Keyword", "AI semantic"],
-            index=1 if emb_df is not None else 0,
+            index=1 if HAS_EMBED else 0,
             help="Keyword search looks for exact text matches. AI semantic search finds similar strategies by meaning and may be imperfect.",
         )
-        if emb_df is None and search_mode == "AI semantic":
+        emb_df = None
+        if q and search_mode == "AI semantic" and HAS_EMBED:
+            # The first semantic query loads the model and embeds every strategy
+            with st.spinner("Preparing AI semantic search..."):
+                emb_df = compute_strategy_embeddings(data_key, df, APP_VERSION)
+        # Covers a missing package and one that is present but fails to import
+        if search_mode == "AI semantic" and emb_df is None and (q or not HAS_EMBED):
             st.caption("Install 'sentence-transformers' to enable AI semantic search.")
 
-    fdf = df.copy()
+    # Combine all filters into one mask so the frame is sliced only once
+    mask = np.ones(len(df), dtype=bool)
     if yr:
-        fdf = fdf[fdf["year"].between(yr[0], yr[1])]
-    if org_type_sel:
-        fdf = fdf[fdf["org_type"].isin(org_type_sel)]
-    if country_sel:
-        fdf = fdf[fdf["country"].isin(country_sel)]
-    if scope_sel:
-        fdf = fdf[fdf["scope"].isin(scope_sel)]
+        mask &= df["year"].between(yr[0], yr[1]).to_numpy(dtype=bool, na_value=False)
+    # A multiselect only narrows the data if it leaves out at least one value
+    # (blanks are never offered as options, so rows with blanks still drop out)
+    if org_type_sel and len(org_type_sel) < opts["org_type"]["n_values"]:
+        mask &= df["org_type"].isin(org_type_sel).to_numpy()
+    if country_sel and len(country_sel) < opts["country"]["n_values"]:
+        mask &= df["country"].isin(country_sel).to_numpy()
+    if scope_sel and len(scope_sel) < opts["scope"]["n_values"]:
+        mask &= df["scope"].isin(scope_sel).to_numpy()
+    use_semantic = emb_df is not None
+    if q and not use_semantic:
+        mask &= keyword_mask(search_corpus(data_key, df), q, mask)
+    # Unfiltered view: reuse the cached (read-only) frame instead of copying it
+    fdf = df if mask.all() else df[mask]
 
     if q:
-        if search_mode == "AI semantic" and emb_df is not None:
+        if use_semantic:
             st.caption("Semantic search active (AI based similarity).")
             fdf = semantic_search(fdf, emb_df, q, top_k=100)
-        else:
-            fdf = simple_search(fdf, q)
         st.caption(f"{len(fdf)} strategies match your query.")
 
     if fdf.empty:
@@ -895,22 +1457,54 @@ with tab_explore:
             "Try broadening filters or removing the search text."
         )
     else:
-        render_explore_charts(fdf)
+        render_explore_charts(data_key, fdf)
         st.markdown("### Strategy details")
-        for _, r in fdf.iterrows():
+
+        # One table widget instead of an expander per row; the full summary
+        # is shown for the selected row only
+        # The selection is held per key, so key it on the dataset and the
+        # filtered rows (in order): any change to either starts unselected
+        # instead of pointing a stale row position at a different strategy
+        rows_key = hash((data_key, fdf.index.to_numpy().tobytes()))
+        has_similarity = "similarity" in fdf.columns
+        detail_cols = ["title", "organisation", "year", "country", "org_type", "scope", "link"]
+        if has_similarity:
+            detail_cols.append("similarity")
+        details = st.dataframe(
+            fdf[detail_cols],
+            column_config={
+                "title": st.column_config.TextColumn("Title", width="large"),
+                "organisation": "Organisation",
+                "year": st.column_config.NumberColumn("Year", format="%d"),
+                "country": "Country",
+                "org_type": "Organisation type",
+                "scope": "Scope",
+                "link": st.column_config.LinkColumn("Document", display_text="Open"),
+                "similarity": st.column_config.NumberColumn("Similarity", format="%.2f"),
+            },
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key=f"explore_details_{rows_key}",
+        )
+
+        selected = details.selection.rows
+        if selected and selected[0] < len(fdf):
+            r = fdf.iloc[selected[0]]
             year_str = int(r["year"]) if pd.notna(r["year"]) else "n a"
-            label = f"{r['title']} — {r['organisation']} ({year_str})"
-            if "similarity" in fdf.columns:
-                label += f"  [similarity {r.get('similarity', 0):.2f}]"
-            with st.expander(label):
-                st.write(r["summary"] or "_No summary provided._")
-                meta = st.columns(4)
-                meta[0].write(f"**Organisation type:** {r['org_type']}")
-                meta[1].write(f"**Country:** {r['country']}")
-                meta[2].write(f"**Scope:** {r['scope']}")
-                meta[3].write(f"**Source:** {r['source']}")
-                if r["link"]:
-                    st.link_button("Open document", r["link"])
+            st.markdown(f"#### {r['title']}")
+            st.caption(f"{r['organisation']} ({year_str})")
+            st.write(r["summary"] or "_No summary provided._")
+            meta = st.columns(4)
+            meta[0].write(f"**Organisation type:** {r['org_type']}")
+            meta[1].write(f"**Country:** {r['country']}")
+            meta[2].write(f"**Scope:** {r['scope']}")
+            meta[3].write(f"**Source:** {r['source']}")
+            if r["link"]:
+                st.link_button("Open document", r["link"])
+        else:
+            st.caption("Select a row to see the strategy summary.")
 
 # ====================================================
 # 🔍 DIAGNOSE (Business priorities, Maturity, Tensions)
@@ -990,7 +1584,8 @@ _You can refer back to these priorities in the Shift and Actions tabs when you d
 
     st.caption(
         "Use the six themes in the Data Maturity Assessment for Government framework "
-        "(Central Digital and Data Office) to rate where you are today."
+        "(Central Digital and Data Office) to rate where you are today. "
+        "Select Update maturity to apply your ratings."
     )
     st.markdown(
         "[Open the framework in a new tab]"
@@ -998,25 +1593,30 @@ _You can refer back to these priorities in the Shift and Actions tabs when you d
         "data-maturity-assessment-for-government-framework-html)"
     )
 
-    cols_theme = st.columns(3)
-    for i, (name, desc) in enumerate(MATURITY_THEMES):
-        with cols_theme[i % 3]:
-            current_val = st.session_state["_maturity_scores"].get(name, 3)
-            st.session_state["_maturity_scores"][name] = st.slider(
-                name,
-                min_value=1,
-                max_value=5,
-                value=current_val,
-                help=desc,
-                format="%d",
-                key=f"mat_{name}",
-            )
-            level_name = MATURITY_SCALE[st.session_state["_maturity_scores"][name]]
-            st.caption(f"Level: {level_name}")
+    # Sliders sit in a form so moving several of them costs one rerun, not one each
+    with st.form("maturity_form", border=False):
+        cols_theme = st.columns(3)
+        for i, (name, desc) in enumerate(MATURITY_THEMES):
+            with cols_theme[i % 3]:
+                current_val = st.session_state["_maturity_scores"].get(name, 3)
+                st.session_state["_maturity_scores"][name] = st.slider(
+                    name,
+                    min_value=1,
+                    max_value=5,
+                    value=current_val,
+                    help=desc,
+                    format="%d",
+                    key=f"mat_{name}",
+                )
+                level_name = MATURITY_SCALE[st.session_state["_maturity_scores"][name]]
+                st.caption(f"Level: {level_name}")
+        st.form_submit_button("Update maturity")
 
     # Overall maturity summary + gauge bar + radar
     m_scores = st.session_state["_maturity_scores"]
-    m_avg = sum(m_scores.values()) / len(m_scores) if m_scores else 0
+    # Theme scores in MATURITY_NAMES order, shared by the average and the radar
+    m_arr = np.fromiter((m_scores[k] for k in MATURITY_NAMES), dtype=np.int8, count=len(MATURITY_NAMES))
+    m_avg = float(m_arr.mean())
     current_level_name = maturity_label(m_avg)
 
     colA, colB = st.columns([1, 1])
@@ -1029,24 +1629,7 @@ _You can refer back to these priorities in the Shift and Actions tabs when you d
             unsafe_allow_html=True,
         )
 
-        gauge_df = pd.DataFrame({"Metric": ["Maturity"], "Score": [m_avg]})
-
-        fig_bar = px.bar(
-            gauge_df,
-            x="Metric",
-            y="Score",
-            title="Overall maturity (1 to 5)",
-            range_y=[0, 5],
-        )
-        fig_bar.update_traces(marker_color=PRIMARY)
-        fig_bar.update_yaxes(
-            tickvals=[1, 2, 3, 4, 5],
-            ticktext=["Beginning", "Emerging", "Learning", "Developing", "Mastering"],
-            title=None,
-        )
-        fig_bar.update_xaxes(title=None, showticklabels=False)
-        fig_bar.update_layout(margin=dict(l=80, r=10, t=40, b=20))
-
+        fig_bar = maturity_gauge(m_avg)
         st.plotly_chart(fig_bar, use_container_width=True)
 
         st.markdown(
@@ -1055,21 +1638,7 @@ _You can refer back to these priorities in the Shift and Actions tabs when you d
 
     # RIGHT: Radar (themes profile, 1–5 scale)
     with colB:
-        dims_m = list(m_scores.keys())
-        vals01 = [m_scores[d] / 5 for d in dims_m]
-        figm = go.Figure()
-        figm.add_trace(radar_trace(vals01, dims_m, "Maturity", opacity=0.6))
-        figm.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, 1],
-                    tickvals=[x / 5 for x in [1, 2, 3, 4, 5]],
-                    ticktext=["1", "2", "3", "4", "5"],
-                )
-            ),
-            title="Maturity profile across six themes (1 to 5 scale)",
-        )
+        figm = maturity_radar(tuple(m_arr.tolist()))
         st.plotly_chart(figm, use_container_width=True)
 
         st.markdown(
@@ -1078,25 +1647,9 @@ _You can refer back to these priorities in the Shift and Actions tabs when you d
         )
 
     # Mini-report export for maturity
-    maturity_rows = []
-    for name, _ in MATURITY_THEMES:
-        score = st.session_state["_maturity_scores"][name]
-        maturity_rows.append(
-            {
-                "Theme": name,
-                "Score (1 to 5)": score,
-                "Level": MATURITY_SCALE[score],
-            }
-        )
-    maturity_rows.append(
-        {
-            "Theme": "Overall (average)",
-            "Score (1 to 5)": round(m_avg, 2),
-            "Level": current_level_name,
-        }
+    maturity_csv = maturity_snapshot_csv(
+        tuple((name, m_scores[name]) for name in MATURITY_NAMES)
     )
-    maturity_df = pd.DataFrame(maturity_rows)
-    maturity_csv = maturity_df.to_csv(index=False).encode("utf-8")
 
     st.download_button(
         "Download maturity snapshot (CSV)",
@@ -1113,77 +1666,78 @@ _You can refer back to these priorities in the Shift and Actions tabs when you d
 
     st.caption(
         "For each lens, 0 means the left label and 100 means the right label. "
-        "Hints and warnings adapt to your maturity profile."
+        "Hints and warnings adapt to your maturity profile. "
+        "Move as many sliders as you like, then select Update lenses to refresh the hints, radar and Shift tab."
     )
 
-    colL, colR = st.columns(2)
-
-    # Current profile
-    with colL:
-        st.markdown("#### Current")
-        cols = st.columns(2)
-        for i, (dim, left_lbl, right_lbl) in enumerate(AXES):
-            with cols[i % 2]:
-                current_val = st.session_state["_current_scores"].get(dim, 50)
-                st.session_state["_current_scores"][dim] = st.slider(
-                    f"{dim} (current)",
-                    min_value=0,
-                    max_value=100,
-                    value=current_val,
-                    format="%d%%",
-                    help=f"{left_lbl} to {right_lbl}",
-                    key=f"cur_{dim}",
-                )
-                st.caption(
-                    f"{left_lbl} ← {st.session_state['_current_scores'][dim]}% → {right_lbl}"
-                )
-
-    # Target profile + hints/conflicts
-    with colR:
-        st.markdown("#### Target")
-        cols = st.columns(2)
-        for i, (dim, left_lbl, right_lbl) in enumerate(AXES):
-            with cols[i % 2]:
-                target_val = st.session_state["_target_scores"].get(dim, 50)
-                st.session_state["_target_scores"][dim] = st.slider(
-                    f"{dim} (target)",
-                    min_value=0,
-                    max_value=100,
-                    value=target_val,
-                    format="%d%%",
-                    help=f"{left_lbl} to {right_lbl}",
-                    key=f"tgt_{dim}",
-                )
-                st.caption(
-                    f"{left_lbl} ← {st.session_state['_target_scores'][dim]}% → {right_lbl}"
-                )
-
-                hint = hint_for_lens(dim, m_avg, current_level_name)
-                if hint:
-                    st.markdown(
-                        f"<div class='info-panel'><strong>Hint:</strong> {hint}</div>",
-                        unsafe_allow_html=True,
+    with st.form("lenses_form", border=False):
+        colL, colR = st.columns(2)
+
+        # Current profile
+        with colL:
+            st.markdown("#### Current")
+            cols = st.columns(2)
+            positions = []
+            for i, (dim, left_lbl, right_lbl) in enumerate(AXES):
+                with cols[i % 2]:
+                    current_val = st.session_state["_current_scores"].get(dim, 50)
+                    st.session_state["_current_scores"][dim] = st.slider(
+                        f"{dim} (current)",
+                        min_value=0,
+                        max_value=100,
+                        value=current_val,
+                        format="%d%%",
+                        help=f"{left_lbl} to {right_lbl}",
+                        key=f"cur_{dim}",
+                    )
+                    positions.append(
+                        f"{left_lbl} ← {st.session_state['_current_scores'][dim]}% → {right_lbl}"
+                    )
+            # One caption for all lenses rather than a widget per slider
+            st.caption("  \n".join(positions))
+
+        # Target profile + hints/conflicts
+        with colR:
+            st.markdown("#### Target")
+            cols = st.columns(2)
+            positions = []
+            for i, (dim, left_lbl, right_lbl) in enumerate(AXES):
+                with cols[i % 2]:
+                    target_val = st.session_state["_target_scores"].get(dim, 50)
+                    st.session_state["_target_scores"][dim] = st.slider(
+                        f"{dim} (target)",
+                        min_value=0,
+                        max_value=100,
+                        value=target_val,
+                        format="%d%%",
+                        help=f"{left_lbl} to {right_lbl}",
+                        key=f"tgt_{dim}",
+                    )
+                    positions.append(
+                        f"{left_lbl} ← {st.session_state['_target_scores'][dim]}% → {right_lbl}"
                     )
 
-                warn = conflict_for_target(
-                    dim, st.session_state["_target_scores"][dim], m_avg
-                )
-                if warn:
-                    st.markdown(
-                        f"<div class='warn'>⚠️ {warn}</div>",
-                        unsafe_allow_html=True,
+                    # Hint and warning go out as one markdown block per lens
+                    notes = []
+                    hint = hint_for_lens(dim, m_avg, current_level_name)
+                    if hint:
+                        notes.append(f"<div class='info-panel'><strong>Hint:</strong> {hint}</div>")
+
+                    warn = conflict_for_target(
+                        dim, st.session_state["_target_scores"][dim], m_avg, current_level_name
                     )
+                    if warn:
+                        notes.append(f"<div class='warn'>⚠️ {warn}</div>")
+                    if notes:
+                        st.markdown("".join(notes), unsafe_allow_html=True)
+            st.caption("  \n".join(positions))
+        st.form_submit_button("Update lenses")
 
     # Twin radar: current vs target
-    dims = [a[0] for a in AXES]
-    cur01 = [st.session_state["_current_scores"][d] / 100 for d in dims]
-    tgt01 = [st.session_state["_target_scores"][d] / 100 for d in dims]
-    fig = go.Figure()
-    fig.add_trace(radar_trace(cur01, dims, "Current", opacity=0.6))
-    fig.add_trace(radar_trace(tgt01, dims, "Target", opacity=0.5))
-    fig.update_layout(
-        polar=dict(radialaxis=dict(visible=True, range=[0, 1])),
-        title="Current and target fingerprints across ten strategic lenses",
+    cur_scores = st.session_state["_current_scores"]
+    tgt_scores = st.session_state["_target_scores"]
+    fig = lens_radar(
+        tuple(cur_scores[d] for d in DIMENSIONS), tuple(tgt_scores[d] for d in DIMENSIONS)
     )
     st.plotly_chart(fig, use_container_width=True)
 
@@ -1199,11 +1753,11 @@ with tab_shift:
     )
 
     ensure_sessions()
-    dims = [a[0] for a in AXES]
-    current = st.session_state.get("_current_scores", {d: 50 for d in dims})
-    target = st.session_state.get("_target_scores", {d: 50 for d in dims})
-    m_scores = st.session_state.get("_maturity_scores", {k: 3 for k, _ in MATURITY_THEMES})
-    m_avg = sum(m_scores.values()) / len(m_scores) if m_scores else 0
+    # ensure_sessions has seeded all three score dicts
+    current = st.session_state["_current_scores"]
+    target = st.session_state["_target_scores"]
+    m_scores = st.session_state["_maturity_scores"]
+    m_avg = float(np.fromiter(m_scores.values(), dtype=np.int8, count=len(m_scores)).mean())
     level_name = maturity_label(m_avg)
     biz_state = st.session_state.get("_biz_priority", {})
 
@@ -1240,36 +1794,15 @@ with tab_shift:
     # Core gap analysis
     st.markdown("### 2) Gap by lens")
 
-    rows = []
-    for d, left_lbl, right_lbl in AXES:
-        diff = target[d] - current[d]
-        mag = abs(diff)
-        direction = (
-            f"toward **{right_lbl}**"
-            if diff > 0
-            else (f"toward **{left_lbl}**" if diff < 0 else "no change")
-        )
-        conflict = conflict_for_target(d, target[d], m_avg)
-        rows.append(
-            {
-                "Lens": d,
-                "Current": current[d],
-                "Target": target[d],
-                "Change needed": diff,
-                "Magnitude": mag,
-                "Direction": direction,
-                "Conflict": bool(conflict),
-                "Conflict note": conflict or "",
-            }
-        )
-    gap_df = pd.DataFrame(rows).sort_values(
-        ["Conflict", "Magnitude"], ascending=[False, False]
+    gap_df = gap_table(
+        tuple(current[d] for d in DIMENSIONS), tuple(target[d] for d in DIMENSIONS), m_avg
     )
+    diff = gap_df["Change needed"].to_numpy()
 
     # Narrative summary
-    moves_left = sum(1 for v in gap_df["Change needed"] if v < 0)
-    moves_right = sum(1 for v in gap_df["Change needed"] if v > 0)
-    zero_moves = sum(1 for v in gap_df["Change needed"] if v == 0)
+    moves_left = int((diff < 0).sum())
+    moves_right = int((diff > 0).sum())
+    zero_moves = len(diff) - moves_left - moves_right
 
     st.markdown(
         f"At overall maturity level **{level_name}** (average {m_avg:.1f} out of 5), "
@@ -1282,15 +1815,7 @@ with tab_shift:
         use_container_width=True,
     )
 
-    bar = px.bar(
-        gap_df.sort_values("Change needed"),
-        x="Change needed",
-        y="Lens",
-        orientation="h",
-        title="Signed change needed (negative means move left, positive means move right)",
-    )
-    color_series = gap_df["Conflict"].map({True: RED, False: PRIMARY})
-    bar.data[0].marker.color = color_series
+    bar = gap_bar(gap_df)
     st.plotly_chart(bar, use_container_width=True)
 
     # Priority list and seed for Actions
@@ -1299,37 +1824,26 @@ with tab_shift:
     st.markdown(f"### 3) Priority shifts (top {TOP_N})")
 
     if len(top):
+        # One pass builds both the bullets and the seed rows for the Actions tab
         bullets = []
-        for _, row in top.iterrows():
-            d = row["Lens"]
-            diff = row["Change needed"]
-            note = row["Conflict note"]
-            left_lbl = [a[1] for a in AXES if a[0] == d][0]
-            right_lbl = [a[2] for a in AXES if a[0] == d][0]
-            if diff > 0:
-                line = f"- **{d}**: shift toward **{right_lbl}** (change of +{int(diff)} points)"
-            elif diff < 0:
-                line = f"- **{d}**: shift toward **{left_lbl}** (change of {int(diff)} points)"
+        actions_rows = []
+        for i, (d, diff, toward, note) in enumerate(
+            zip(
+                top["Lens"].to_numpy(),
+                top["Change needed"].to_numpy(),
+                top["Direction"].to_numpy(),
+                top["Conflict note"].to_numpy(),
+            ),
+            start=1,
+        ):
+            direction = ACTION_DIRECTIONS[d][np.sign(diff) + 1]
+            if diff:
+                line = f"- **{d}**: shift {toward} (change of {int(diff):+d} points)"
             else:
                 line = f"- **{d}**: no change"
             if note:
                 line += f"  \n  <span class='warn'>⚠️ {note}</span>"
             bullets.append(line)
-        st.markdown("\n".join(bullets), unsafe_allow_html=True)
-
-        # Seed actions table for Actions tab
-        actions_rows = []
-        for i, (_, row) in enumerate(top.iterrows(), start=1):
-            d = row["Lens"]
-            diff = row["Change needed"]
-            left_lbl = [a[1] for a in AXES if a[0] == d][0]
-            right_lbl = [a[2] for a in AXES if a[0] == d][0]
-            if diff > 0:
-                direction = f"toward {right_lbl}"
-            elif diff < 0:
-                direction = f"toward {left_lbl}"
-            else:
-                direction = "no change"
             actions_rows.append(
                 {
                     "Priority": i,
@@ -1341,6 +1855,8 @@ with tab_shift:
                     "Status": "",
                 }
             )
+        st.markdown("\n".join(bullets), unsafe_allow_html=True)
+
         st.session_state["_actions_df"] = pd.DataFrame(actions_rows)
     else:
         st.info(
@@ -1834,45 +2350,6 @@ that inform data strategy work in the public sector.
         ),
     ]
 
-    def render_resource_cards(resources, cols_per_row=3):
-        for i in range(0, len(resources), cols_per_row):
-            row_items = resources[i : i + cols_per_row]
-            cols = st.columns(len(row_items))
-            for col, (title, desc, url) in zip(cols, row_items):
-                with col:
-                    st.markdown(
-                        f"""
-                        <div style="
-                            background-color: #1e293b;
-                            border-radius: 12px;
-                            padding: 16px 16px 14px 16px;
-                            margin-bottom: 12px;
-                            box-shadow: 0 4px 12px rgba(15, 23, 42, 0.35);
-                            border: 1px solid rgba(148, 163, 184, 0.4);
-                        ">
-                            <div style="font-weight: 600; font-size: 0.95rem; color: #e5e7eb; margin-bottom: 6px;">
-                                {title}
-                            </div>
-                            <div style="font-size: 0.85rem; color: #cbd5f5; margin-bottom: 10px;">
-                                {desc}
-                            </div>
-                            <a href="{url}" target="_blank" style="
-                                display: inline-flex;
-                                align-items: center;
-                                gap: 6px;
-                                font-size: 0.85rem;
-                                font-weight: 500;
-                                color: #38bdf8;
-                                text-decoration: none;
-                            ">
-                                <span>Open resource</span>
-                                <span style="font-size: 0.9rem;">↗</span>
-                            </a>
-                        </div>
-                        """,
-                        unsafe_allow_html=True,
-                    )
-
     render_resource_cards(resources)
 
 # ====================================================
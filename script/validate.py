@@ -1,28 +1,42 @@
-import csv, sys, re
+import re
+import sys
+import numpy as np
+import pandas as pd
 
 REQUIRED = ["title","organisation","year","scope","link","summary"]
-URL_PATTERN = re.compile(r"^https?://")
+SCOPES = ["national","departmental","agency","devolved","local","cross-government"]
+YEAR_PATTERN = re.compile(r"\d{4}")
+URL_PATTERN = re.compile(r"https?://")
 
 def main():
     path = "data/strategies.csv"
-    with open(path, encoding="utf-8") as f:
-        rows = list(csv.DictReader(f))
-    ok = True
-    for i, r in enumerate(rows, start=2):
-        for k in REQUIRED:
-            if not r.get(k):
-                print(f"[Row {i}] Missing required field: {k}")
-                ok = False
-        if r.get("year") and not re.match(r"^\d{4}$", r["year"]):
-            print(f"[Row {i}] Year is not YYYY: {r['year']}"); ok = False
-        if r.get("link") and not URL_PATTERN.match(r["link"]):
-            print(f"[Row {i}] Link not http/https: {r['link']}"); ok = False
-        if r.get("scope") not in {"national","departmental","agency","devolved","local","cross-government"}:
-            print(f"[Row {i}] Scope invalid: {r['scope']}"); ok = False
-        if r.get("summary") and len(r["summary"]) > 280:
-            print(f"[Row {i}] Summary too long (>280 chars)"); ok = False
-    if ok:
-        print("✓ strategies.csv looks good.")
+    df = pd.read_csv(path, dtype=str, keep_default_na=False, encoding="utf-8")
+    df = df.reindex(columns=REQUIRED).fillna("")
+
+    # One vectorised pass per check; rows are only visited to print problems
+    missing = df.eq("").to_numpy()
+    bad_year = (df["year"].ne("") & ~df["year"].str.fullmatch(YEAR_PATTERN)).to_numpy()
+    bad_link = (df["link"].ne("") & ~df["link"].str.match(URL_PATTERN)).to_numpy()
+    bad_scope = (~df["scope"].isin(SCOPES)).to_numpy()
+    bad_sum = (df["summary"].str.len() > 280).to_numpy()
+
+    bad = missing.any(axis=1) | bad_year | bad_link | bad_scope | bad_sum
+    # Collect every message first and write them out in one go
+    errors = []
+    for j in np.flatnonzero(bad):
+        i = j + 2
+        for k in np.asarray(REQUIRED)[missing[j]]:
+            errors.append(f"[Row {i}] Missing required field: {k}")
+        if bad_year[j]:
+            errors.append(f"[Row {i}] Year is not YYYY: {df['year'].iat[j]}")
+        if bad_link[j]:
+            errors.append(f"[Row {i}] Link not http/https: {df['link'].iat[j]}")
+        if bad_scope[j]:
+            errors.append(f"[Row {i}] Scope invalid: {df['scope'].iat[j]}")
+        if bad_sum[j]:
+            errors.append(f"[Row {i}] Summary too long (>280 chars)")
+    ok = not errors
+    print("\n".join(errors) if errors else "✓ strategies.csv looks good.")
     sys.exit(0 if ok else 1)
 
 if __name__ == "__main__":